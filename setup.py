@@ -51,6 +51,7 @@ setup(
             'pytest-pycodestyle',
             'pytest-cov',
             'pytest-env',
+            'pytest-xdist',
         ],
         'examples': [
             'jupyterlab~=2.0',
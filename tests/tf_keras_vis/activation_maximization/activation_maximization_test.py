@@ -781,6 +781,7 @@ class TestActivationMaximizationWithMultipleIOModel():
                 assert not np.all(result[1] == 1.0)
 
 
+@pytest.mark.xdist_group(name="mixed_precision")
 @pytest.mark.skipif(version(tf.version.VERSION) < version("2.4.0"),
                     reason="This test is enabled only when tensorflow version is 2.4.0+.")
 class TestMixedPrecision():
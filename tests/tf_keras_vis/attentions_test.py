@@ -309,6 +309,7 @@ class TestXcamWithDenseModel():
             assert result.shape == (1, 8, 8)
 
 
+@pytest.mark.xdist_group(name="mixed_precision")
 @pytest.mark.skipif(version(tf.version.VERSION) < version("2.4.0"),
                     reason="This test is enabled when tensorflow version is 2.4.0+.")
 class TestMixedPrecision():
@@ -1,4 +1,5 @@
 import os
+
 import pytest
 import tensorflow as tf
 from packaging.version import parse as version
@@ -19,21 +20,45 @@ def _source_of_models():
     return [None] + _get_supported_policies()
 
 
-def _save_and_load(model, source, path):
-    if source is None:
-        return model
-    if source == "mixed_float16":
+def _build_and_load(factory, source, path):
+    # Pin the policy while building so that the model a module-scoped fixture
+    # provides doesn't depend on which test in the module requests it first.
+    if version(tf.version.VERSION) >= version("2.4.0"):
         policy = tf.keras.mixed_precision.global_policy()
         tf.keras.mixed_precision.set_global_policy(source)
         try:
+            model = factory()
             model.save(path)
         finally:
             tf.keras.mixed_precision.set_global_policy(policy)
     else:
+        model = factory()
         model.save(path)
     return tf.keras.models.load_model(path)
 
 
+def _capture_initial_state(model):
+    activations = [layer.activation for layer in model.layers if hasattr(layer, 'activation')]
+    return model.get_weights(), activations
+
+
+def _restore_initial_state(model, initial_state):
+    weights, activations = initial_state
+    model.set_weights(weights)
+    layers = (layer for layer in model.layers if hasattr(layer, 'activation'))
+    for layer, activation in zip(layers, activations):
+        layer.activation = activation
+    return model
+
+
+def _setup_model(source):
+    if isinstance(source, tuple):
+        return _restore_initial_state(*source)
+    # When there is no saved model, rebuild under the currently active policy
+    # so that tests can't pollute each other via in-place modifications.
+    return source()
+
+
 @pytest.fixture(scope='function', params=_get_supported_policies())
 def mixed_precision(request):
     if version(tf.version.VERSION) >= version("2.4.0"):
@@ -43,35 +68,86 @@ def mixed_precision(request):
         tf.keras.mixed_precision.set_global_policy("float32")
 
 
-@pytest.fixture(scope='function', params=_source_of_models())
-def dense_model(request, tmpdir):
-    return _save_and_load(mock_dense_model(), request.param, os.path.join(tmpdir, 'dense-model.h5'))
+@pytest.fixture(scope='module', params=_source_of_models())
+def _dense_model_source(request, tmpdir_factory):
+    if request.param is None:
+        return mock_dense_model
+    path = os.path.join(str(tmpdir_factory.mktemp('models')), 'dense-model.h5')
+    model = _build_and_load(mock_dense_model, request.param, path)
+    return model, _capture_initial_state(model)
+
+
+@pytest.fixture(scope='function')
+def dense_model(_dense_model_source):
+    return _setup_model(_dense_model_source)
+
+
+@pytest.fixture(scope='module', params=_source_of_models())
+def _conv_model_source(request, tmpdir_factory):
+    if request.param is None:
+        return mock_conv_model
+    path = os.path.join(str(tmpdir_factory.mktemp('models')), 'conv-model.h5')
+    model = _build_and_load(mock_conv_model, request.param, path)
+    return model, _capture_initial_state(model)
+
+
+@pytest.fixture(scope='function')
+def conv_model(_conv_model_source):
+    return _setup_model(_conv_model_source)
+
+
+@pytest.fixture(scope='module', params=_source_of_models())
+def _conv_sigmoid_model_source(request, tmpdir_factory):
+    if request.param is None:
+        return mock_conv_model_with_sigmoid_output
+    path = os.path.join(str(tmpdir_factory.mktemp('models')),
+                        'conv-model-with-sigmoid-output.h5')
+    model = _build_and_load(mock_conv_model_with_sigmoid_output, request.param, path)
+    return model, _capture_initial_state(model)
+
+
+@pytest.fixture(scope='function')
+def conv_sigmoid_model(_conv_sigmoid_model_source):
+    return _setup_model(_conv_sigmoid_model_source)
+
+
+@pytest.fixture(scope='module', params=_source_of_models())
+def _multiple_inputs_model_source(request, tmpdir_factory):
+    if request.param is None:
+        return mock_multiple_inputs_model
+    path = os.path.join(str(tmpdir_factory.mktemp('models')), 'multiple-inputs-model.h5')
+    model = _build_and_load(mock_multiple_inputs_model, request.param, path)
+    return model, _capture_initial_state(model)
 
 
-@pytest.fixture(scope='function', params=_source_of_models())
-def conv_model(request, tmpdir):
-    return _save_and_load(mock_conv_model(), request.param, os.path.join(tmpdir, 'conv-model.h5'))
+@pytest.fixture(scope='function')
+def multiple_inputs_model(_multiple_inputs_model_source):
+    return _setup_model(_multiple_inputs_model_source)
 
 
-@pytest.fixture(scope='function', params=_source_of_models())
-def conv_sigmoid_model(request, tmpdir):
-    return _save_and_load(mock_conv_model_with_sigmoid_output(), request.param,
-                          os.path.join(tmpdir, 'conv-model-with-sigmoid-output.h5'))
+@pytest.fixture(scope='module', params=_source_of_models())
+def _multiple_outputs_model_source(request, tmpdir_factory):
+    if request.param is None:
+        return mock_multiple_outputs_model
+    path = os.path.join(str(tmpdir_factory.mktemp('models')), 'multiple-outputs-model.h5')
+    model = _build_and_load(mock_multiple_outputs_model, request.param, path)
+    return model, _capture_initial_state(model)
 
 
-@pytest.fixture(scope='function', params=_source_of_models())
-def multiple_inputs_model(request, tmpdir):
-    return _save_and_load(mock_multiple_inputs_model(), request.param,
-                          os.path.join(tmpdir, 'multiple-inputs-model.h5'))
+@pytest.fixture(scope='function')
+def multiple_outputs_model(_multiple_outputs_model_source):
+    return _setup_model(_multiple_outputs_model_source)
 
 
-@pytest.fixture(scope='function', params=_source_of_models())
-def multiple_outputs_model(request, tmpdir):
-    return _save_and_load(mock_multiple_outputs_model(), request.param,
-                          os.path.join(tmpdir, 'multiple-outputs-model.h5'))
+@pytest.fixture(scope='module', params=_source_of_models())
+def _multiple_io_model_source(request, tmpdir_factory):
+    if request.param is None:
+        return mock_multiple_io_model
+    path = os.path.join(str(tmpdir_factory.mktemp('models')), 'multiple-io-model.h5')
+    model = _build_and_load(mock_multiple_io_model, request.param, path)
+    return model, _capture_initial_state(model)
 
 
-@pytest.fixture(scope='function', params=_source_of_models())
-def multiple_io_model(request, tmpdir):
-    return _save_and_load(mock_multiple_io_model(), request.param,
-                          os.path.join(tmpdir, 'multiple-io-model.h5'))
+@pytest.fixture(scope='function')
+def multiple_io_model(_multiple_io_model_source):
+    return _setup_model(_multiple_io_model_source)
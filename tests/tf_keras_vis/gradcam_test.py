@@ -2,7 +2,7 @@ import pytest
 
 from tf_keras_vis.gradcam import Gradcam
 from tf_keras_vis.utils.scores import CategoricalScore
-from tf_keras_vis.utils.test import dummy_sample
+from tf_keras_vis.utils.test import dummy_sample, mock_conv1d_model
 
 
 class TestGradcam():
@@ -11,3 +11,11 @@ class TestGradcam():
         cam = Gradcam(conv_model)
         result = cam(CategoricalScore(0), dummy_sample((1, 8, 8, 3)), normalize_gradient=True)
         assert result.shape == (1, 8, 8)
+
+    @pytest.mark.usefixtures("mixed_precision")
+    def test__call__if_model_is_conv1d(self):
+        # The rank-2 cam can't go through tf.image.resize,
+        # so this covers the scipy zoom fallback.
+        cam = Gradcam(mock_conv1d_model())
+        result = cam(CategoricalScore(0), dummy_sample((1, 8, 3)))
+        assert result.shape == (1, 8)
@@ -32,6 +32,19 @@ class TestSaliency():
                           smooth_samples=smooth_samples)
         assert result.shape == (1, 8, 8)
 
+    @pytest.mark.parametrize("smooth_samples", [1, 3, 100])
+    @pytest.mark.usefixtures("mixed_precision")
+    def test__call__if_smoothing_is_active_with_multiple_indices(self, smooth_samples, conv_model):
+        indices = [0, 1]
+
+        def score(output):
+            assert output.shape[0] == len(indices)
+            return [output[i, index] for i, index in enumerate(indices)]
+
+        saliency = Saliency(conv_model)
+        result = saliency(score, dummy_sample((2, 8, 8, 3)), smooth_samples=smooth_samples)
+        assert result.shape == (2, 8, 8)
+
     @pytest.mark.usefixtures("mixed_precision")
     def test__call__if_model_has_only_dense_layers(self, dense_model):
         saliency = Saliency(dense_model)
@@ -76,6 +89,7 @@ class TestSaliencyWithMultipleIOModel():
     pass
 
 
+@pytest.mark.xdist_group(name="mixed_precision")
 @pytest.mark.skipif(version(tf.version.VERSION) < version("2.4.0"),
                     reason="This test is enabled when tensorflow version is 2.4.0+.")
 class TestMixedPrecision():
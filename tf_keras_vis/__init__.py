@@ -69,7 +69,7 @@ class ModelVisualization(ABC):
             raise ValueError(
                 f"The model has {len(self.model.inputs)} inputs, "
                 f"but the number of seed-inputs tensors you passed is {len(seed_inputs)}.")
-        seed_inputs = (x if tf.is_tensor(x) else tf.constant(x) for x in seed_inputs)
+        seed_inputs = (x if tf.is_tensor(x) else tf.convert_to_tensor(x) for x in seed_inputs)
         seed_inputs = (tf.expand_dims(x, axis=0) if len(x.shape) == len(tensor.shape[1:]) else x
                        for x, tensor in zip(seed_inputs, self.model.inputs))
         seed_inputs = list(seed_inputs)
@@ -95,5 +95,5 @@ class ModelVisualization(ABC):
                     score = tf.constant(score)
             else:
                 score = tf.constant(score)
-        score = tf.math.reduce_mean(score, axis=tuple(range(score.ndim))[1:])
+        score = tf.math.reduce_mean(score, axis=tuple(range(score.shape.rank))[1:])
         return score
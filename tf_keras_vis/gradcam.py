@@ -1,15 +1,42 @@
+import os
 import warnings
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from typing import Union
 
 import numpy as np
 import tensorflow as tf
 import tensorflow.keras.backend as K
+from packaging.version import parse as version
 from scipy.ndimage import zoom
 
 from . import ModelVisualization
-from .utils import is_mixed_precision, standardize, zoom_factor
+from .utils import standardize, zoom_factor
 from .utils.model_modifiers import ExtractIntermediateLayerForGradcam as ModelModifier
 
+_GRAD_STEP_CACHE_LIMIT = 8
+
+# Turned off for the process once jit compilation has failed.
+_XLA_AVAILABLE = True
+
+_ZOOM_EXECUTOR = None
+
+
+def _get_zoom_executor() -> ThreadPoolExecutor:
+    global _ZOOM_EXECUTOR
+    if _ZOOM_EXECUTOR is None:
+        _ZOOM_EXECUTOR = ThreadPoolExecutor(max_workers=os.cpu_count())
+    return _ZOOM_EXECUTOR
+
+
+def _standardize_inplace(cam) -> np.ndarray:
+    axis = tuple(range(cam.ndim)[1:])
+    max_value = np.max(cam, axis=axis, keepdims=True)
+    min_value = np.min(cam, axis=axis, keepdims=True)
+    cam -= min_value
+    cam /= (max_value - min_value + K.epsilon())
+    return cam
+
 
 class Gradcam(ModelVisualization):
     """Grad-CAM
@@ -22,13 +49,17 @@ class Gradcam(ModelVisualization):
     Todo:
         * Write examples
     """
+    def __init__(self, model, model_modifier=None, clone=True) -> None:
+        super().__init__(model, model_modifier=model_modifier, clone=clone)
+        self._grad_step_cache = OrderedDict()
+
     def __call__(
             self,
             score,
             seed_input,
             penultimate_layer=None,
             seek_penultimate_conv_layer=True,
-            activation_modifier=lambda cam: K.relu(cam),
+            activation_modifier=tf.nn.relu,
             training=False,
             normalize_gradient=None,  # Disabled option.
             expand_cam=True,
@@ -57,6 +88,10 @@ class Gradcam(ModelVisualization):
                         ...
                     ]
 
+                ![Note] The score function is executed while tracing the gradient step
+                as a tf.function, so it must be implemented with TensorFlow operations
+                (eager-only code such as calling `.numpy()` or branching on tensor values
+                won't work).
             seed_input (Union[tf.Tensor,np.ndarray,list[tf.Tensor,np.ndarray]]):
                 A tensor or a list of them to input in the model.
                 When the model has multiple inputs, you have to pass a list.
@@ -71,7 +106,9 @@ class Gradcam(ModelVisualization):
                 when the layer specified by `penultimate_layer` is not `convolutional` layer.
                 Defaults to True.
             activation_modifier (Callable, optional):  A function to modify activation.
-                Defaults to `lambda cam: K.relu(cam)`.
+                Because it is applied in the traced gradient step,
+                it must be built with TensorFlow operations.
+                Defaults to `tf.nn.relu`.
             training (bool, optional): A bool that indicates
                 whether the model's training-mode on or off. Defaults to False.
             normalize_gradient (bool, optional): ![Note] This option is now disabled.
@@ -104,39 +141,109 @@ class Gradcam(ModelVisualization):
 
         # Processing gradcam
         model = ModelModifier(penultimate_layer, seek_penultimate_conv_layer)(self.model)
-
-        with tf.GradientTape(watch_accessed_variables=False) as tape:
-            tape.watch(seed_inputs)
-            outputs = model(seed_inputs, training=training)
-            outputs, penultimate_output = outputs[:-1], outputs[-1]
-            score_values = self._calculate_scores(outputs, scores)
-        grads = tape.gradient(score_values,
-                              penultimate_output,
-                              unconnected_gradients=unconnected_gradients)
-
-        # When mixed precision enabled
-        if is_mixed_precision(model):
-            grads = tf.cast(grads, dtype=model.variable_dtype)
-            penultimate_output = tf.cast(penultimate_output, dtype=model.variable_dtype)
-
-        weights = K.mean(grads, axis=tuple(range(grads.ndim)[1:-1]), keepdims=True)
-        cam = np.sum(np.multiply(penultimate_output, weights), axis=-1)
-        if activation_modifier is not None:
-            cam = activation_modifier(cam)
+        cam = self._run_grad_step(model, scores, activation_modifier, training,
+                                  unconnected_gradients, seed_inputs)
 
         if not expand_cam:
-            if standardize_cam:
-                cam = standardize(cam)
-            return cam
+            cam = cam.numpy()
+            return standardize(cam) if standardize_cam else cam
 
         # Visualizing
-        factors = (zoom_factor(cam.shape, X.shape) for X in seed_inputs)
-        cam = [zoom(cam, factor, order=1) for factor in factors]
+        if cam.ndim == 3 and all(len(X.shape) == 4 for X in seed_inputs):
+            cam = [
+                tf.image.resize(cam[..., tf.newaxis], X.shape[1:3], method='bilinear')
+                for X in seed_inputs
+            ]
+            cam = [x[..., 0].numpy() for x in cam]
+        else:
+            cam_array = np.asarray(cam)
+            factors = [zoom_factor(cam_array.shape, X.shape) for X in seed_inputs]
+            # The same rounded shape scipy.ndimage.zoom computes internally, so that
+            # a factor that doesn't divide evenly degrades instead of raising.
+            buffers = (np.empty(tuple(int(round(s * f)) for s, f in zip(cam_array.shape, factor)),
+                                dtype=cam_array.dtype) for factor in factors)
+            cam = list(_get_zoom_executor().map(
+                lambda args: zoom(cam_array, args[0], order=1, output=args[1]),
+                zip(factors, buffers)))
         if standardize_cam:
-            cam = [standardize(x) for x in cam]
+            cam = [_standardize_inplace(x) for x in cam]
         if len(self.model.inputs) == 1 and not isinstance(seed_input, list):
             cam = cam[0]
         return cam
 
+    def _run_grad_step(self, model, scores, activation_modifier, training, unconnected_gradients,
+                       seed_inputs):
+        key = (model, tuple(scores), activation_modifier, training, unconnected_gradients,
+               tuple(tuple(x.shape) for x in seed_inputs))
+        grad_step = self._grad_step_cache.get(key)
+        if grad_step is not None:
+            self._grad_step_cache.move_to_end(key)
+            return grad_step(seed_inputs)
+        global _XLA_AVAILABLE
+        if _XLA_AVAILABLE:
+            grad_step = self._build_grad_step(model, scores, activation_modifier, training,
+                                              unconnected_gradients, jit_compile=True)
+            try:
+                cam = grad_step(seed_inputs)
+            except (tf.errors.InvalidArgumentError, tf.errors.UnimplementedError,
+                    tf.errors.UnknownError):
+                # The error types jit compilation raises when XLA is unavailable on this
+                # platform or unsupported for this model. When the step fails without XLA
+                # too, the cause was not XLA, so the error propagates and the flag is kept.
+                grad_step = self._build_grad_step(model, scores, activation_modifier, training,
+                                                  unconnected_gradients, jit_compile=False)
+                cam = grad_step(seed_inputs)
+                _XLA_AVAILABLE = False
+        else:
+            grad_step = self._build_grad_step(model, scores, activation_modifier, training,
+                                              unconnected_gradients, jit_compile=False)
+            cam = grad_step(seed_inputs)
+        self._grad_step_cache[key] = grad_step
+        # The Score classes shipped with this library compare by value, so the cache
+        # hits even when a fresh score is constructed per call. Arbitrary callables
+        # are keyed by identity and may miss every call, so evict the least recently
+        # used entries to keep the cache bounded.
+        while len(self._grad_step_cache) > _GRAD_STEP_CACHE_LIMIT:
+            self._grad_step_cache.popitem(last=False)
+        return cam
+
+    def _build_grad_step(self, model, scores, activation_modifier, training,
+                         unconnected_gradients, jit_compile=False):
+        def _grad_step(inputs):
+            with tf.GradientTape(watch_accessed_variables=False) as tape:
+                tape.watch(inputs)
+                outputs = model(inputs, training=training)
+                outputs, penultimate_output = outputs[:-1], outputs[-1]
+                score_values = self._calculate_scores(outputs, scores)
+            grads = tape.gradient(score_values,
+                                  penultimate_output,
+                                  output_gradients=[tf.ones_like(v) for v in score_values],
+                                  unconnected_gradients=unconnected_gradients)
+            spatial_axes = tuple(range(1, grads.shape.rank - 1))
+            weights = tf.reduce_mean(grads, axis=spatial_axes)
+            # One contiguous GEMV per batch element instead of a broadcasted
+            # multiply followed by a second pass for the channel sum.
+            shape = tf.shape(penultimate_output)
+            flattened = tf.reshape(penultimate_output, (shape[0], -1, shape[-1]))
+            cam = tf.linalg.matvec(flattened, tf.cast(weights, penultimate_output.dtype))
+            cam = tf.reshape(cam, shape[:-1])
+            # When mixed precision enabled, only the small cam tensor is up-casted.
+            if cam.dtype != model.variable_dtype:
+                cam = tf.cast(cam, dtype=model.variable_dtype)
+            # Applied here (rather than after the traced step) so that XLA can fuse
+            # the activation with the preceding reduction.
+            if activation_modifier is not None:
+                cam = activation_modifier(cam)
+            return cam
+
+        options = {}
+        if version(tf.version.VERSION) < version("2.9.0"):
+            options['experimental_relax_shapes'] = True
+        else:
+            options['reduce_retracing'] = True
+        if jit_compile and version(tf.version.VERSION) >= version("2.5.0"):
+            options['jit_compile'] = True
+        return tf.function(_grad_step, **options)
+
 
 from tf_keras_vis.gradcam_plus_plus import GradcamPlusPlus  # noqa: F401, E402
@@ -25,7 +25,7 @@ class GradcamPlusPlus(ModelVisualization):
                  seed_input,
                  penultimate_layer=-1,
                  seek_penultimate_conv_layer=True,
-                 activation_modifier=lambda cam: K.relu(cam),
+                 activation_modifier=tf.nn.relu,
                  training=False,
                  expand_cam=True,
                  standardize_cam=True,
@@ -67,7 +67,7 @@ class GradcamPlusPlus(ModelVisualization):
                 when the layer specified by `penultimate_layer` is not `convolutional` layer.
                 Defaults to True.
             activation_modifier (Callable, optional):  A function to modify activation.
-                Defaults to `lambda cam: K.relu(cam)`.
+                Defaults to `tf.nn.relu`.
             training (bool, optional): A bool that indicates
                 whether the model's training-mode on or off. Defaults to False.
             expand_cam (bool, optional): True to resize cam to the same as input image size.
@@ -142,7 +142,7 @@ class GradcamPlusPlus(ModelVisualization):
             axis=tuple(np.arange(len(deep_linearization_weights.shape))[1:-1]),
             keepdims=True)
 
-        cam = K.sum(deep_linearization_weights * penultimate_output, axis=-1)
+        cam = tf.einsum('...c,...c->...', deep_linearization_weights, penultimate_output)
         if activation_modifier is not None:
             cam = activation_modifier(cam)
 
@@ -89,22 +89,23 @@ class Saliency(ModelVisualization):
         # Processing saliency
         if smooth_samples > 0:
             smooth_samples = get_num_of_steps_allowed(smooth_samples)
-            seed_inputs = (tf.tile(X, (smooth_samples, ) + tuple(np.ones(X.ndim - 1, np.int)))
-                           for X in seed_inputs)
-            seed_inputs = (tf.reshape(X, (smooth_samples, -1) + tuple(X.shape[1:]))
-                           for X in seed_inputs)
-            seed_inputs = ((X, tuple(range(X.ndim)[2:])) for X in seed_inputs)
+            scores = [self._get_score_for_smoothing(score, smooth_samples) for score in scores]
+            seed_inputs = ((X, tuple(range(X.ndim)[1:])) for X in seed_inputs)
             seed_inputs = ((X, smooth_noise * (tf.math.reduce_max(X, axis=axis, keepdims=True) -
                                                tf.math.reduce_min(X, axis=axis, keepdims=True)))
                            for X, axis in seed_inputs)
-            seed_inputs = (X + np.random.normal(0., sigma, X.shape) for X, sigma in seed_inputs)
+            seed_inputs = ((tf.tile(X, (smooth_samples, ) + (1, ) * (X.ndim - 1)),
+                            tf.tile(sigma, (smooth_samples, ) + (1, ) * (sigma.ndim - 1)))
+                           for X, sigma in seed_inputs)
+            seed_inputs = (X + sigma * tf.random.normal(tf.shape(X), dtype=X.dtype)
+                           for X, sigma in seed_inputs)
             seed_inputs = list(seed_inputs)
-            total = (np.zeros_like(X[0]) for X in seed_inputs)
-            for i in range(smooth_samples):
-                grads = self._get_gradients([X[i] for X in seed_inputs], scores, gradient_modifier,
-                                            training, unconnected_gradients)
-                total = (total + g for total, g in zip(total, grads))
-            grads = [g / smooth_samples for g in total]
+            grads = self._get_gradients(seed_inputs, scores, gradient_modifier, training,
+                                        unconnected_gradients)
+            grads = [
+                tf.reduce_mean(tf.reshape(g, (smooth_samples, -1) + tuple(g.shape[1:])), axis=0)
+                for g in grads
+            ]
         else:
             grads = self._get_gradients(seed_inputs, scores, gradient_modifier, training,
                                         unconnected_gradients)
@@ -117,6 +118,18 @@ class Saliency(ModelVisualization):
             grads = grads[0]
         return grads
 
+    def _get_score_for_smoothing(self, score, smooth_samples):
+        # Because the noisy samples are stacked into the batch dimension,
+        # the score function must be applied per sample
+        # so that it sees batches of the size it was written for.
+        def score_per_sample(output):
+            score_values = (score(chunk) for chunk in tf.split(output, smooth_samples, axis=0))
+            score_values = (value if tf.is_tensor(value) else tf.stack(value, axis=0)
+                            for value in score_values)
+            return tf.concat(list(score_values), axis=0)
+
+        return score_per_sample
+
     def _get_gradients(self, seed_inputs, scores, gradient_modifier, training,
                        unconnected_gradients):
         with tf.GradientTape(watch_accessed_variables=False, persistent=True) as tape:
@@ -27,7 +27,7 @@ class Scorecam(ModelVisualization):
                  seed_input,
                  penultimate_layer=-1,
                  seek_penultimate_conv_layer=True,
-                 activation_modifier=lambda cam: K.relu(cam),
+                 activation_modifier=tf.nn.relu,
                  batch_size=32,
                  max_N=None,
                  training=False,
@@ -70,7 +70,7 @@ class Scorecam(ModelVisualization):
                 when the layer specified by `penultimate_layer` is not `convolutional` layer.
                 Defaults to True.
             activation_modifier (Callable, optional):  A function to modify activation.
-                Defaults to `lambda cam: K.relu(cam)`.
+                Defaults to `tf.nn.relu`.
             batch_size (int, optional): The number of samples per batch. Defaults to 32.
             max_N (int, optional): Setting None or under Zero is that we do NOT recommend,
                 because it takes a long time to calculate CAM.
@@ -1,3 +1,4 @@
+import weakref
 from abc import ABC, abstractmethod
 from typing import Union
 
@@ -118,12 +119,26 @@ class GuidedBackpropagation(ModelModifier):
 
 
 class ExtractIntermediateLayerForGradcam(ModelModifier):
+    # Modified models per original model. The weak reference avoids leaking models
+    # that are only alive in this cache.
+    _cache = weakref.WeakKeyDictionary()
+
     def __init__(self, penultimate_layer=None, seek_conv_layer=True, include_model_outputs=True):
         self.penultimate_layer = penultimate_layer
         self.seek_conv_layer = seek_conv_layer
         self.include_model_outputs = include_model_outputs
 
     def __call__(self, model):
+        # The layer argument is resolved (and validated) BEFORE looking up the cache,
+        # so that invalid arguments raise instead of hash-colliding with cached entries.
+        _layer = self._find_penultimate_layer(model)
+        key = (_layer, self.include_model_outputs)
+        cached_models = self._cache.setdefault(model, {})
+        if key not in cached_models:
+            cached_models[key] = self._extract_intermediate_layer(model, _layer)
+        return cached_models[key]
+
+    def _find_penultimate_layer(self, model):
         _layer = self.penultimate_layer
         if not isinstance(_layer, tf.keras.layers.Layer):
             if _layer is None:
@@ -139,6 +154,9 @@ class ExtractIntermediateLayerForGradcam(ModelModifier):
         if _layer is None:
             raise ValueError("Unable to determine penultimate `Conv` layer. "
                              f"`penultimate_layer`={self.penultimate_layer}")
+        return _layer
+
+    def _extract_intermediate_layer(self, model, _layer):
         penultimate_output = _layer.output
         if len(penultimate_output.shape) < 3:
             raise ValueError(
@@ -51,6 +51,12 @@ class InactiveScore(Score):
     def __call__(self, output) -> tf.Tensor:
         return output * 0.0
 
+    def __eq__(self, other) -> bool:
+        return type(other) is type(self)
+
+    def __hash__(self) -> int:
+        return hash(type(self))
+
 
 class BinaryScore(Score):
     """A score function that collects the scores from model output
@@ -78,7 +84,7 @@ class BinaryScore(Score):
             raise ValueError(f"target_values is required. target_values: {target_values}")
 
     def __call__(self, output) -> tf.Tensor:
-        if not (output.ndim == 2 and output.shape[1] == 1):
+        if not (output.shape.rank == 2 and output.shape[1] == 1):
             raise ValueError(f"`output` shape must be (batch_size, 1), but was {output.shape}")
         output = tf.reshape(output, (-1, ))
         target_values = self.target_values
@@ -86,6 +92,12 @@ class BinaryScore(Score):
             target_values = target_values * output.shape[0]
         return tf.math.abs(output - (1.0 - tf.constant(target_values, dtype=output.dtype)))
 
+    def __eq__(self, other) -> bool:
+        return type(other) is type(self) and other.target_values == self.target_values
+
+    def __hash__(self) -> int:
+        return hash((type(self), tuple(self.target_values)))
+
 
 class CategoricalScore(Score):
     """A score function that collects the scores from model output
@@ -111,9 +123,9 @@ class CategoricalScore(Score):
             raise ValueError(f"`indices` is required. indices: {indices}")
 
     def __call__(self, output) -> tf.Tensor:
-        if output.ndim < 2:
+        if output.shape.rank < 2:
             raise ValueError("`output` ndim must be 2 or more (batch_size, ..., channels), "
-                             f"but was {output.ndim}")
+                             f"but was {output.shape.rank}")
         if output.shape[-1] <= max(self.indices):
             raise ValueError(
                 f"Invalid index value. indices: {self.indices}, output.shape: {output.shape}")
@@ -122,5 +134,11 @@ class CategoricalScore(Score):
             indices = indices * output.shape[0]
         score = [output[i, ..., index] for i, index in enumerate(indices)]
         score = tf.stack(score, axis=0)
-        score = tf.math.reduce_mean(score, axis=tuple(range(score.ndim))[1:])
+        score = tf.math.reduce_mean(score, axis=tuple(range(score.shape.rank))[1:])
         return score
+
+    def __eq__(self, other) -> bool:
+        return type(other) is type(self) and other.indices == self.indices
+
+    def __hash__(self) -> int:
+        return hash((type(self), tuple(self.indices)))
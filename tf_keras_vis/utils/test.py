@@ -4,7 +4,8 @@ import numpy as np
 import pytest
 import tensorflow as tf
 from tensorflow.keras import backend as K
-from tensorflow.keras.layers import Activation, Conv2D, Dense, GlobalAveragePooling2D, Input
+from tensorflow.keras.layers import (Activation, Conv1D, Conv2D, Dense, GlobalAveragePooling1D,
+                                     GlobalAveragePooling2D, Input)
 from tensorflow.keras.models import Model
 
 from ..activation_maximization.callbacks import Callback
@@ -36,6 +37,15 @@ def mock_conv_model():
     return Model(inputs=inputs, outputs=x)
 
 
+def mock_conv1d_model():
+    inputs = Input((8, 3), name='input_1')
+    x = Conv1D(6, 3, activation='relu', name='conv_1')(inputs)
+    x = GlobalAveragePooling1D()(x)
+    x = Dense(2, name='dense_1')(x)
+    x = Activation('softmax', dtype=tf.float32, name='output_1')(x)
+    return Model(inputs=inputs, outputs=x)
+
+
 def mock_multiple_inputs_model():
     input_1 = Input((8, 8, 3), name='input_1')
     input_2 = Input((10, 10, 3), name='input_2')